@@ -1,17 +1,23 @@
+import os
 from collections.abc import AsyncGenerator
+from contextvars import ContextVar
 from datetime import timedelta
+from typing import Any
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import ASGITransport, AsyncClient, Request, Response
+from sqlalchemy import URL, bindparam, event, make_url, select, text
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
     AsyncSession,
     create_async_engine,
 )
+from sqlalchemy.orm import raiseload
 
 from src.admin.models import SystemSettingsBase
 from src.auth.service import create_access_token
+from src.budgets.models import Budget
 from src.config import settings
 from src.database import Base, get_async_session
 from src.main import app
@@ -20,11 +26,77 @@ from src.users.schemas import UserCreate
 from src.users.service import create_user
 from tests import utils
 
+# Upper bound on SQL statements a single API request may issue during tests.
+# Catches N+1 regressions in any endpoint without per-test boilerplate.
+MAX_QUERIES_PER_REQUEST = 50
+
+# Statements issued by the API request currently in flight (None between requests)
+_request_queries: ContextVar[list[str] | None] = ContextVar(
+    "_request_queries", default=None
+)
+
+# Shared by the budget fixtures so the select is only constructed once at
+# import; raiseload makes a stray access to Budget.members fail loudly
+_BUDGET_FOR_OWNER = (
+    select(Budget)
+    .where(Budget.owner_id == bindparam("owner_id"))
+    .options(raiseload("*"))
+)
+
+
+def _record_request_query(
+    _conn: Any, _cursor: Any, statement: str, *_args: Any
+) -> None:
+    queries = _request_queries.get()
+    if queries is not None:
+        queries.append(statement)
+
+
+async def _start_request_queries(_request: Request) -> None:
+    _request_queries.set([])
+
+
+async def _check_request_queries(response: Response) -> None:
+    queries = _request_queries.get() or []
+    _request_queries.set(None)
+    if len(queries) > MAX_QUERIES_PER_REQUEST:
+        request = response.request
+        pytest.fail(
+            f"{request.method} {request.url.path} issued {len(queries)} SQL "
+            f"statements (limit {MAX_QUERIES_PER_REQUEST}); possible N+1 query"
+        )
+
+
+async def _worker_database_url() -> URL:
+    """Database URL for this pytest-xdist worker, recreating its database.
+
+    Each worker gets its own database so parallel workers never contend on
+    the shared test users or system settings rows. The database is dropped
+    and recreated every session because create_all skips existing tables,
+    so a database left over from an older schema would go stale. Without
+    xdist the configured database is used as-is.
+    """
+    url = make_url(settings.database_url)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return url
+
+    database = f"{url.database}_test_{worker}"
+    admin_engine = create_async_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        async with admin_engine.connect() as conn:
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{database}"'))
+            await conn.execute(text(f'CREATE DATABASE "{database}"'))
+    finally:
+        await admin_engine.dispose()
+    return url.set(database=database)
+
 
 @pytest.fixture(scope="session")
 async def _engine() -> AsyncGenerator[AsyncEngine]:
     """Module-scoped engine."""
-    engine = create_async_engine(settings.database_url, echo=False)
+    engine = create_async_engine(await _worker_database_url(), echo=False)
+    event.listen(engine.sync_engine, "before_cursor_execute", _record_request_query)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(SystemSettingsBase.metadata.create_all)
@@ -56,6 +128,10 @@ async def _async_client() -> AsyncGenerator[AsyncClient]:
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
+        event_hooks={
+            "request": [_start_request_queries],
+            "response": [_check_request_queries],
+        },
     ) as ac:
         yield ac
 
@@ -87,7 +163,11 @@ async def client(
 async def authenticated_client(
     client: AsyncClient, valid_access_token: str
 ) -> AsyncClient:
-    """Client with valid authentication header."""
+    """Client with valid authentication header.
+
+    Reuses the session-scoped client and token, so no login round trip or
+    new transport is needed per test.
+    """
     client.headers["Authorization"] = f"Bearer {valid_access_token}"
     return client
 
@@ -127,6 +207,20 @@ async def test_user2(_base_session: AsyncSession) -> User:
     )
 
 
+@pytest.fixture
+async def user_budget(session: AsyncSession, test_user: User) -> Budget:
+    """The budget owned by the test user."""
+    result = await session.execute(_BUDGET_FOR_OWNER, {"owner_id": test_user.id})
+    return result.scalar_one()
+
+
+@pytest.fixture
+async def user2_budget(session: AsyncSession, test_user2: User) -> Budget:
+    """The budget owned by the second test user."""
+    result = await session.execute(_BUDGET_FOR_OWNER, {"owner_id": test_user2.id})
+    return result.scalar_one()
+
+
 @pytest.fixture(scope="session")
 async def expired_access_token(test_user: User) -> str:
     """Session-scoped expired access token for the test user."""
@@ -0,0 +1,142 @@
+"""Builders for the rows report tests seed.
+
+Each builder assigns a client-side ``uuid7`` id so dependent rows can reference
+it before the session is flushed. Defaults cover the common case; pass keyword
+overrides for anything a test cares about. ``seed_spending`` bulk inserts
+allocated spending for tests that never read those rows back.
+"""
+
+from datetime import date
+from typing import Any
+from uuid import uuid7
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.accounts.models import Account, AccountType
+from src.allocations.models import Allocation
+from src.budgets.models import Budget
+from src.envelopes.models import Envelope
+from src.payees.models import Payee
+from src.recurring_transactions.models import FrequencyUnit, RecurringTransaction
+from src.transactions.models import Transaction, TransactionStatus
+
+
+def make_account(budget: Budget, name: str = "Checking", **kwargs: Any) -> Account:
+    """Build an on-budget checking account unless kwargs say otherwise."""
+    kwargs.setdefault("account_type", AccountType.CHECKING)
+    kwargs.setdefault("include_in_budget", True)
+    return Account(id=uuid7(), budget_id=budget.id, name=name, **kwargs)
+
+
+def make_payee(budget: Budget, name: str) -> Payee:
+    """Build a payee in the budget."""
+    return Payee(id=uuid7(), budget_id=budget.id, name=name)
+
+
+def make_envelope(
+    budget: Budget, name: str, current_balance: int = 0, **kwargs: Any
+) -> Envelope:
+    """Build an envelope holding current_balance."""
+    return Envelope(
+        id=uuid7(),
+        budget_id=budget.id,
+        name=name,
+        current_balance=current_balance,
+        **kwargs,
+    )
+
+
+def make_txn(
+    budget: Budget,
+    account: Account,
+    payee: Payee | None,
+    *,
+    amount: int,
+    txn_date: date,
+    status: TransactionStatus = TransactionStatus.POSTED,
+    **kwargs: Any,
+) -> Transaction:
+    """Build a transaction on txn_date, posted unless status says otherwise."""
+    return Transaction(
+        id=uuid7(),
+        budget_id=budget.id,
+        account_id=account.id,
+        payee_id=payee.id if payee else None,
+        date=txn_date,
+        amount=amount,
+        status=status,
+        **kwargs,
+    )
+
+
+def make_recurring(
+    budget: Budget,
+    account: Account,
+    payee: Payee,
+    *,
+    amount: int,
+    next_occurrence_date: date,
+    envelope: Envelope | None = None,
+    frequency_value: int = 1,
+    frequency_unit: FrequencyUnit = FrequencyUnit.MONTHS,
+    **kwargs: Any,
+) -> RecurringTransaction:
+    """Build a recurring transaction, monthly unless the frequency says otherwise."""
+    kwargs.setdefault("start_date", date.today())
+    return RecurringTransaction(
+        id=uuid7(),
+        budget_id=budget.id,
+        account_id=account.id,
+        payee_id=payee.id,
+        envelope_id=envelope.id if envelope else None,
+        amount=amount,
+        frequency_value=frequency_value,
+        frequency_unit=frequency_unit,
+        next_occurrence_date=next_occurrence_date,
+        **kwargs,
+    )
+
+
+async def seed_spending(
+    session: AsyncSession,
+    budget: Budget,
+    account: Account,
+    payee: Payee,
+    spending: list[tuple[Envelope, int, date]],
+) -> None:
+    """Insert one posted transaction per (envelope, amount, date), fully allocated.
+
+    Both inserts are executemany statements; pending parents are autoflushed
+    ahead of the first one.
+    """
+    result = await session.execute(
+        insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+        [
+            {
+                "budget_id": budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "date": txn_date,
+                "amount": amount,
+                "status": TransactionStatus.POSTED,
+            }
+            for _, amount, txn_date in spending
+        ],
+    )
+    await session.execute(
+        insert(Allocation),
+        [
+            {
+                "budget_id": budget.id,
+                "envelope_id": envelope.id,
+                "transaction_id": txn_id,
+                "group_id": uuid7(),
+                "amount": amount,
+                "date": txn_date,
+            }
+            for txn_id, (envelope, amount, txn_date) in zip(
+                result.scalars().all(), spending, strict=True
+            )
+        ],
+    )
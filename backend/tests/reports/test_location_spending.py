@@ -1,7 +1,10 @@
 from datetime import date, timedelta
+from typing import Any
+from uuid import uuid7
 
+import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.accounts.models import Account, AccountType
@@ -9,51 +12,54 @@ from src.budgets.models import Budget
 from src.locations.models import Location
 from src.payees.models import Payee
 from src.transactions.models import Transaction, TransactionStatus, TransactionType
-from src.users.models import User
+from tests.utils import AUTH_QUERIES, count_queries
+
+# Auth lookups plus the two report aggregates
+MAX_QUERIES = AUTH_QUERIES + 2
 
 
 async def test_location_spending_basic(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test basic location spending report."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    location = Location(id=uuid7(), budget_id=user_budget.id, name="New York")
     session.add_all([account, payee, location])
-    await session.flush()
 
     today = date.today()
 
     # Create transactions at this location
-    for amount in [-10000, -15000]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            location_id=location.id,
-            date=today,
-            amount=amount,
-            status=TransactionStatus.POSTED,
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "location_id": location.id,
+                "date": today,
+                "amount": amount,
+                "status": TransactionStatus.POSTED,
+            }
+            for amount in [-10000, -15000]
+        ],
+    )
+
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
         )
-        session.add(txn)
-    await session.flush()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert data["include_no_location"] is True
@@ -69,46 +75,53 @@ async def test_location_spending_basic(
 async def test_location_spending_multiple_locations(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test multiple locations sorted by total spent."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    ny = Location(budget_id=budget.id, name="New York")
-    ohio = Location(budget_id=budget.id, name="Ohio")
-    session.add_all([account, payee, ny, ohio])
-    await session.flush()
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    session.add_all([account, payee])
+
+    result = await session.execute(
+        insert(Location).returning(Location.id, sort_by_parameter_order=True),
+        [
+            {"budget_id": user_budget.id, "name": "New York"},
+            {"budget_id": user_budget.id, "name": "Ohio"},
+        ],
+    )
+    ny_id, ohio_id = result.scalars().all()
 
     today = date.today()
 
     # NY: $500, Ohio: $200
-    for location, amount in [(ny, -50000), (ohio, -20000)]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            location_id=location.id,
-            date=today,
-            amount=amount,
-            status=TransactionStatus.POSTED,
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "location_id": location_id,
+                "date": today,
+                "amount": amount,
+                "status": TransactionStatus.POSTED,
+            }
+            for location_id, amount in [(ny_id, -50000), (ohio_id, -20000)]
+        ],
+    )
+
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
         )
-        session.add(txn)
-    await session.flush()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # Should be sorted by total spent (descending)
@@ -122,30 +135,25 @@ async def test_location_spending_multiple_locations(
 async def test_location_spending_includes_no_location(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that transactions without location are included."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    location = Location(id=uuid7(), budget_id=user_budget.id, name="New York")
     session.add_all([account, payee, location])
-    await session.flush()
 
     today = date.today()
 
     # Transaction with location
     txn_with = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=account.id,
         payee_id=payee.id,
         location_id=location.id,
@@ -155,7 +163,7 @@ async def test_location_spending_includes_no_location(
     )
     # Transaction without location
     txn_without = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=account.id,
         payee_id=payee.id,
         location_id=None,
@@ -166,10 +174,12 @@ async def test_location_spending_includes_no_location(
     session.add_all([txn_with, txn_without])
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert len(data["items"]) == 2
@@ -182,30 +192,25 @@ async def test_location_spending_includes_no_location(
 async def test_location_spending_exclude_no_location(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test excluding transactions without location."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    location = Location(id=uuid7(), budget_id=user_budget.id, name="New York")
     session.add_all([account, payee, location])
-    await session.flush()
 
     today = date.today()
 
     # Transaction with location
     txn_with = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=account.id,
         payee_id=payee.id,
         location_id=location.id,
@@ -215,7 +220,7 @@ async def test_location_spending_exclude_no_location(
     )
     # Transaction without location
     txn_without = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=account.id,
         payee_id=payee.id,
         location_id=None,
@@ -226,11 +231,13 @@ async def test_location_spending_exclude_no_location(
     session.add_all([txn_with, txn_without])
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending",
-        params={"include_no_location": False},
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending",
+            params={"include_no_location": False},
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert data["include_no_location"] is False
@@ -241,47 +248,47 @@ async def test_location_spending_exclude_no_location(
 async def test_location_spending_date_filter(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test date range filtering."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    location = Location(id=uuid7(), budget_id=user_budget.id, name="New York")
     session.add_all([account, payee, location])
-    await session.flush()
 
     jan = date(2024, 1, 15)
     feb = date(2024, 2, 15)
 
-    for txn_date in [jan, feb]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            location_id=location.id,
-            date=txn_date,
-            amount=-10000,
-            status=TransactionStatus.POSTED,
-        )
-        session.add(txn)
-    await session.flush()
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "location_id": location.id,
+                "date": txn_date,
+                "amount": -10000,
+                "status": TransactionStatus.POSTED,
+            }
+            for txn_date in [jan, feb]
+        ],
+    )
 
     # Filter to January only
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending",
-        params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending",
+            params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert data["start_date"] == "2024-01-01"
@@ -293,182 +300,149 @@ async def test_location_spending_date_filter(
 async def test_location_spending_filter_by_location(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test filtering to specific locations."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    ny = Location(budget_id=budget.id, name="New York")
-    ohio = Location(budget_id=budget.id, name="Ohio")
-    session.add_all([account, payee, ny, ohio])
-    await session.flush()
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    session.add_all([account, payee])
 
-    today = date.today()
-
-    for location in [ny, ohio]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            location_id=location.id,
-            date=today,
-            amount=-10000,
-            status=TransactionStatus.POSTED,
-        )
-        session.add(txn)
-    await session.flush()
-
-    # Filter to NY only
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending",
-        params={"location_id": str(ny.id)},
-    )
-    assert response.status_code == 200
-    data = response.json()
-
-    assert len(data["items"]) == 1
-    assert data["items"][0]["location_name"] == "New York"
-
-
-async def test_location_spending_excludes_income(
-    authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,
-) -> None:
-    """Test that positive transactions are excluded."""
     result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
+        insert(Location).returning(Location.id, sort_by_parameter_order=True),
+        [
+            {"budget_id": user_budget.id, "name": "New York"},
+            {"budget_id": user_budget.id, "name": "Ohio"},
+        ],
     )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
-    session.add_all([account, payee, location])
-    await session.flush()
+    ny_id, ohio_id = result.scalars().all()
 
     today = date.today()
 
-    # Expense
-    expense_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=location.id,
-        date=today,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
-    # Income (should be excluded)
-    income_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=location.id,
-        date=today,
-        amount=50000,
-        status=TransactionStatus.POSTED,
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "location_id": location_id,
+                "date": today,
+                "amount": -10000,
+                "status": TransactionStatus.POSTED,
+            }
+            for location_id in [ny_id, ohio_id]
+        ],
     )
-    session.add_all([expense_txn, income_txn])
-    await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
+    # Filter to NY only
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending",
+            params={"location_id": str(ny_id)},
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert len(data["items"]) == 1
-    assert data["items"][0]["total_spent"] == 10000
+    assert data["items"][0]["location_name"] == "New York"
 
 
-async def test_location_spending_excludes_scheduled(
+@pytest.mark.parametrize(
+    "excluded",
+    [
+        # Income
+        [{"amount": 50000}],
+        # Scheduled
+        [
+            {
+                "amount": -20000,
+                "date": date.today() + timedelta(days=7),
+                "status": TransactionStatus.SCHEDULED,
+            }
+        ],
+        # Adjustments, with and without a location (the latter must also stay
+        # out of the no-location bucket)
+        [
+            {"amount": -50000, "transaction_type": TransactionType.ADJUSTMENT},
+            {
+                "amount": -100000,
+                "location_id": None,
+                "transaction_type": TransactionType.ADJUSTMENT,
+            },
+        ],
+    ],
+    ids=["income", "scheduled", "adjustments"],
+)
+async def test_location_spending_exclusions(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
+    excluded: list[dict[str, Any]],
 ) -> None:
-    """Test that scheduled transactions are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
+    """Test that income, scheduled and adjustment transactions are excluded."""
     account = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    location = Location(id=uuid7(), budget_id=user_budget.id, name="New York")
     session.add_all([account, payee, location])
-    await session.flush()
 
-    today = date.today()
-
-    # Posted
-    posted_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=location.id,
-        date=today,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
-    # Scheduled (should be excluded)
-    scheduled_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=location.id,
-        date=today + timedelta(days=7),
-        amount=-20000,
-        status=TransactionStatus.SCHEDULED,
+    # Regular expense (should be included)
+    expense = {
+        "budget_id": user_budget.id,
+        "account_id": account.id,
+        "payee_id": payee.id,
+        "location_id": location.id,
+        "date": date.today(),
+        "amount": -10000,
+        "status": TransactionStatus.POSTED,
+        "transaction_type": TransactionType.STANDARD,
+    }
+    session.add_all(
+        [Transaction(**expense)]
+        + [Transaction(**(expense | overrides)) for overrides in excluded]
     )
-    session.add_all([posted_txn, scheduled_txn])
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
+    # Only the regular expense should be included
     assert len(data["items"]) == 1
-    assert data["items"][0]["total_spent"] == 10000
+    item = data["items"][0]
+    assert item["location_name"] == "New York"
+    assert item["total_spent"] == 10000
+    assert item["transaction_count"] == 1
 
 
 async def test_location_spending_empty(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test with no transactions."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert data["items"] == []
@@ -477,127 +451,46 @@ async def test_location_spending_empty(
 async def test_location_spending_unauthorized(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,  # noqa: ARG001
-    test_user2: User,
+    user2_budget: Budget,
 ) -> None:
     """Test that users cannot access other budgets' reports."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user2.id)
-    )
-    other_budget = result.scalar_one()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{other_budget.id}/reports/location-spending"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user2_budget.id}/reports/location-spending"
+        )
     assert response.status_code == 403
-
-
-async def test_location_spending_excludes_adjustments(
-    authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,
-) -> None:
-    """Test that adjustment transactions are excluded from location spending."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
-    session.add_all([account, payee, location])
-    await session.flush()
-
-    today = date.today()
-
-    # Regular expense (should be included)
-    regular_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=location.id,
-        date=today,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-        transaction_type=TransactionType.STANDARD,
-    )
-    # Adjustment with location (should be excluded)
-    adjustment_with_location = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=location.id,
-        date=today,
-        amount=-50000,
-        status=TransactionStatus.POSTED,
-        transaction_type=TransactionType.ADJUSTMENT,
-    )
-    # Adjustment without location (should be excluded from no-location bucket)
-    adjustment_no_location = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        location_id=None,
-        date=today,
-        amount=-100000,
-        status=TransactionStatus.POSTED,
-        transaction_type=TransactionType.ADJUSTMENT,
-    )
-    session.add_all([regular_txn, adjustment_with_location, adjustment_no_location])
-    await session.flush()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
-    assert response.status_code == 200
-    data = response.json()
-
-    # Only the regular transaction should be included
-    assert len(data["items"]) == 1
-    assert data["items"][0]["location_name"] == "New York"
-    assert data["items"][0]["total_spent"] == 10000  # Only the $100 regular expense
-    assert data["items"][0]["transaction_count"] == 1
+    assert len(queries) <= MAX_QUERIES
 
 
 async def test_location_spending_excludes_internal_transfers(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that internal transfers (budget → budget) are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     checking = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
     credit_card = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Credit Card",
         account_type=AccountType.CREDIT_CARD,
         include_in_budget=True,
     )
-    payee = Payee(budget_id=budget.id, name="Store")
-    location = Location(budget_id=budget.id, name="New York")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
+    location = Location(id=uuid7(), budget_id=user_budget.id, name="New York")
     session.add_all([checking, credit_card, payee, location])
-    await session.flush()
 
     today = date.today()
 
     # Regular expense (should be included)
     regular_txn = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=checking.id,
         payee_id=payee.id,
         location_id=location.id,
@@ -610,7 +503,7 @@ async def test_location_spending_excludes_internal_transfers(
     # Internal transfer: checking → credit card (both budget accounts)
     # This should be EXCLUDED - it's just moving money within the budget
     transfer_out = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=checking.id,
         payee_id=None,
         location_id=None,
@@ -620,7 +513,7 @@ async def test_location_spending_excludes_internal_transfers(
         transaction_type=TransactionType.TRANSFER,
     )
     transfer_in = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=credit_card.id,
         payee_id=None,
         location_id=None,
@@ -637,10 +530,12 @@ async def test_location_spending_excludes_internal_transfers(
     transfer_in.linked_transaction_id = transfer_out.id
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # Only the regular expense should be included, not the internal transfer
@@ -652,36 +547,32 @@ async def test_location_spending_excludes_internal_transfers(
 async def test_location_spending_includes_transfers_to_tracking(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that transfers to tracking accounts ARE included (money leaving budget)."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     checking = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Checking",
         account_type=AccountType.CHECKING,
         include_in_budget=True,
     )
     investment = Account(
-        budget_id=budget.id,
+        id=uuid7(),
+        budget_id=user_budget.id,
         name="Investment",
         account_type=AccountType.INVESTMENT,
         include_in_budget=False,  # Tracking account
     )
-    payee = Payee(budget_id=budget.id, name="Store")
+    payee = Payee(id=uuid7(), budget_id=user_budget.id, name="Store")
     session.add_all([checking, investment, payee])
-    await session.flush()
 
     today = date.today()
 
     # Transfer: checking → investment (budget → tracking)
     # This SHOULD be included - money is leaving the budget
     transfer_out = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=checking.id,
         payee_id=None,
         location_id=None,
@@ -691,7 +582,7 @@ async def test_location_spending_includes_transfers_to_tracking(
         transaction_type=TransactionType.TRANSFER,
     )
     transfer_in = Transaction(
-        budget_id=budget.id,
+        budget_id=user_budget.id,
         account_id=investment.id,
         payee_id=None,
         location_id=None,
@@ -708,10 +599,12 @@ async def test_location_spending_includes_transfers_to_tracking(
     transfer_in.linked_transaction_id = transfer_out.id
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/location-spending"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/location-spending"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # The transfer to tracking should appear in "(No location)"
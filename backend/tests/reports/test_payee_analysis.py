@@ -2,59 +2,47 @@ from datetime import date, timedelta
 from uuid import uuid7
 
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.accounts.models import Account, AccountType
 from src.allocations.models import Allocation
 from src.budgets.models import Budget
-from src.envelopes.models import Envelope
-from src.payees.models import Payee
 from src.transactions.models import Transaction, TransactionStatus
-from src.users.models import User
+from tests.reports.factories import make_account, make_envelope, make_payee, make_txn
+from tests.utils import AUTH_QUERIES, count_queries
+
+# Auth lookups plus the single report aggregate
+MAX_QUERIES = AUTH_QUERIES + 1
+
+# Allocation group ids for the envelope filter test; never asserted on
+GROCERIES_GROUP_ID, GAS_GROUP_ID = uuid7(), uuid7()
 
 
 async def test_payee_analysis_basic(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test basic payee analysis report."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Whole Foods")
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Whole Foods")
     session.add_all([account, payee])
-    await session.flush()
 
-    today = date.today()
     yesterday = today - timedelta(days=1)
 
     # Create multiple transactions at the same payee
     for txn_date, amount in [(yesterday, -5000), (today, -7500)]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=txn_date,
-            amount=amount,
-            status=TransactionStatus.POSTED,
-        )
+        txn = make_txn(user_budget, account, payee, amount=amount, txn_date=txn_date)
         session.add(txn)
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert len(data["items"]) == 1
@@ -69,51 +57,45 @@ async def test_payee_analysis_basic(
 async def test_payee_analysis_multiple_payees_sorted(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test multiple payees sorted by total spent."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    whole_foods = Payee(budget_id=budget.id, name="Whole Foods")
-    amazon = Payee(budget_id=budget.id, name="Amazon")
-    shell = Payee(budget_id=budget.id, name="Shell Gas")
-    session.add_all([account, whole_foods, amazon, shell])
-    await session.flush()
-
     today = date.today()
+    account = make_account(user_budget)
+    whole_foods = make_payee(user_budget, "Whole Foods")
+    amazon = make_payee(user_budget, "Amazon")
+    shell = make_payee(user_budget, "Shell Gas")
+    session.add_all([account, whole_foods, amazon, shell])
 
     # Amazon: $500, Whole Foods: $300, Shell: $100
     spending = [
-        (amazon.id, -50000),
-        (whole_foods.id, -30000),
-        (shell.id, -10000),
+        (amazon, -50000),
+        (whole_foods, -30000),
+        (shell, -10000),
     ]
 
-    for payee_id, amount in spending:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee_id,
-            date=today,
-            amount=amount,
-            status=TransactionStatus.POSTED,
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "date": today,
+                "amount": amount,
+                "status": TransactionStatus.POSTED,
+            }
+            for payee, amount in spending
+        ],
+    )
+
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis"
         )
-        session.add(txn)
-    await session.flush()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis"
-    )
     assert response.status_code == 200
+    # One aggregate regardless of payee count: no per-payee lookups
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # Should be sorted by total spent (descending)
@@ -129,188 +111,118 @@ async def test_payee_analysis_multiple_payees_sorted(
 async def test_payee_analysis_date_filter(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test date range filtering."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
     session.add_all([account, payee])
-    await session.flush()
 
     jan = date(2024, 1, 15)
     feb = date(2024, 2, 15)
 
     for txn_date in [jan, feb]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=txn_date,
-            amount=-10000,
-            status=TransactionStatus.POSTED,
-        )
+        txn = make_txn(user_budget, account, payee, amount=-10000, txn_date=txn_date)
         session.add(txn)
     await session.flush()
 
     # Filter to January only
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis",
-        params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis",
+            params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert data["start_date"] == "2024-01-01"
     assert data["end_date"] == "2024-01-31"
     assert len(data["items"]) == 1
-    assert data["items"][0]["transaction_count"] == 1
-    assert data["items"][0]["last_transaction_date"] == "2024-01-15"
+    item = data["items"][0]
+    assert item["transaction_count"] == 1
+    assert item["last_transaction_date"] == "2024-01-15"
 
 
 async def test_payee_analysis_envelope_filter(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test filtering by envelope."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    groceries = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
-    gas = Envelope(budget_id=budget.id, name="Gas", current_balance=0)
-    session.add_all([account, payee, groceries, gas])
-    await session.flush()
-
     today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    groceries = make_envelope(user_budget, "Groceries")
+    gas = make_envelope(user_budget, "Gas")
 
     # Transaction allocated to groceries
-    txn1 = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=today,
+    txn1 = make_txn(user_budget, account, payee, amount=-10000, txn_date=today)
+    alloc1 = Allocation(
+        budget_id=user_budget.id,
+        envelope_id=groceries.id,
+        transaction_id=txn1.id,
+        group_id=GROCERIES_GROUP_ID,
         amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(txn1)
-    await session.flush()
-    session.add(
-        Allocation(
-            budget_id=budget.id,
-            envelope_id=groceries.id,
-            transaction_id=txn1.id,
-            group_id=uuid7(),
-            amount=-10000,
-            date=today,
-        )
+        date=today,
     )
 
     # Transaction allocated to gas
-    txn2 = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=today,
+    txn2 = make_txn(user_budget, account, payee, amount=-5000, txn_date=today)
+    alloc2 = Allocation(
+        budget_id=user_budget.id,
+        envelope_id=gas.id,
+        transaction_id=txn2.id,
+        group_id=GAS_GROUP_ID,
         amount=-5000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(txn2)
-    await session.flush()
-    session.add(
-        Allocation(
-            budget_id=budget.id,
-            envelope_id=gas.id,
-            transaction_id=txn2.id,
-            group_id=uuid7(),
-            amount=-5000,
-            date=today,
-        )
+        date=today,
     )
+    session.add_all([account, payee, groceries, gas, txn1, txn2, alloc1, alloc2])
     await session.flush()
 
     # Filter to groceries only
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis",
-        params={"envelope_id": str(groceries.id)},
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis",
+            params={"envelope_id": str(groceries.id)},
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert len(data["items"]) == 1
-    assert data["items"][0]["total_spent"] == 10000
-    assert data["items"][0]["transaction_count"] == 1
+    item = data["items"][0]
+    assert item["total_spent"] == 10000
+    assert item["transaction_count"] == 1
 
 
 async def test_payee_analysis_min_total_filter(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test minimum total spending filter."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    big_spender = Payee(budget_id=budget.id, name="Big Store")
-    small_spender = Payee(budget_id=budget.id, name="Small Store")
-    session.add_all([account, big_spender, small_spender])
-    await session.flush()
-
     today = date.today()
+    account = make_account(user_budget)
+    big_spender = make_payee(user_budget, "Big Store")
+    small_spender = make_payee(user_budget, "Small Store")
+    session.add_all([account, big_spender, small_spender])
 
     # Big store: $500
-    txn1 = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=big_spender.id,
-        date=today,
-        amount=-50000,
-        status=TransactionStatus.POSTED,
-    )
+    txn1 = make_txn(user_budget, account, big_spender, amount=-50000, txn_date=today)
     # Small store: $50
-    txn2 = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=small_spender.id,
-        date=today,
-        amount=-5000,
-        status=TransactionStatus.POSTED,
-    )
+    txn2 = make_txn(user_budget, account, small_spender, amount=-5000, txn_date=today)
     session.add_all([txn1, txn2])
     await session.flush()
 
     # Filter to min $100 total
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis",
-        params={"min_total": 10000},  # $100 in cents
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis",
+            params={"min_total": 10000},  # $100 in cents
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # Only big store should be included
@@ -321,52 +233,28 @@ async def test_payee_analysis_min_total_filter(
 async def test_payee_analysis_excludes_income(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that positive transactions (income) are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    store = Payee(budget_id=budget.id, name="Store")
-    employer = Payee(budget_id=budget.id, name="Employer")
-    session.add_all([account, store, employer])
-    await session.flush()
-
     today = date.today()
+    account = make_account(user_budget)
+    store = make_payee(user_budget, "Store")
+    employer = make_payee(user_budget, "Employer")
+    session.add_all([account, store, employer])
 
     # Expense
-    expense_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=store.id,
-        date=today,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
+    expense_txn = make_txn(user_budget, account, store, amount=-10000, txn_date=today)
     # Income (should be excluded)
-    income_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=employer.id,
-        date=today,
-        amount=500000,
-        status=TransactionStatus.POSTED,
-    )
+    income_txn = make_txn(user_budget, account, employer, amount=500000, txn_date=today)
     session.add_all([expense_txn, income_txn])
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # Only expense payee should be included
@@ -377,74 +265,55 @@ async def test_payee_analysis_excludes_income(
 async def test_payee_analysis_excludes_scheduled(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that scheduled transactions are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    session.add_all([account, payee])
-    await session.flush()
-
     today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    session.add_all([account, payee])
 
     # Posted
-    posted_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=today,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
+    posted_txn = make_txn(user_budget, account, payee, amount=-10000, txn_date=today)
     # Scheduled (should be excluded)
-    scheduled_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=today + timedelta(days=7),
+    scheduled_txn = make_txn(
+        user_budget,
+        account,
+        payee,
         amount=-20000,
+        txn_date=today + timedelta(days=7),
         status=TransactionStatus.SCHEDULED,
     )
     session.add_all([posted_txn, scheduled_txn])
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     # Only posted transaction should be counted
     assert len(data["items"]) == 1
-    assert data["items"][0]["total_spent"] == 10000
-    assert data["items"][0]["transaction_count"] == 1
+    item = data["items"][0]
+    assert item["total_spent"] == 10000
+    assert item["transaction_count"] == 1
 
 
 async def test_payee_analysis_empty(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test with no transactions."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/payee-analysis"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user_budget.id}/reports/payee-analysis"
+        )
     assert response.status_code == 200
+    assert len(queries) <= MAX_QUERIES
     data = response.json()
 
     assert data["items"] == []
@@ -453,16 +322,12 @@ async def test_payee_analysis_empty(
 async def test_payee_analysis_unauthorized(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,  # noqa: ARG001
-    test_user2: User,
+    user2_budget: Budget,
 ) -> None:
     """Test that users cannot access other budgets' reports."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user2.id)
-    )
-    other_budget = result.scalar_one()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{other_budget.id}/reports/payee-analysis"
-    )
+    with count_queries(session.bind.sync_engine) as queries:
+        response = await authenticated_client.get(
+            f"/api/v1/budgets/{user2_budget.id}/reports/payee-analysis"
+        )
     assert response.status_code == 403
+    assert len(queries) <= MAX_QUERIES
@@ -1,50 +1,43 @@
 from datetime import date, timedelta
-from uuid import uuid7
+from uuid import UUID, uuid7
 
+import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.accounts.models import Account, AccountType
 from src.allocations.models import Allocation
 from src.budgets.models import Budget
 from src.envelopes.models import Envelope
-from src.payees.models import Payee
 from src.transactions.models import Transaction, TransactionStatus
-from src.users.models import User
+from tests.reports.factories import make_account, make_envelope, make_payee
+
+# Every goal in this module saves toward $10,000
+GOAL_TARGET = 1000000
+
+
+def savings_goal_url(budget_id: UUID) -> str:
+    """Build the savings goal progress report URL for a budget."""
+    return f"/api/v1/budgets/{budget_id}/reports/savings-goal-progress"
 
 
 async def test_savings_goal_progress_basic(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test basic savings goal progress report."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Employer")
-    # Goal: $10,000, current: $5,000 (50%)
-    envelope = Envelope(
-        budget_id=budget.id,
-        name="Emergency Fund",
+    # Current: $5,000 (50%)
+    envelope = make_envelope(
+        user_budget,
+        "Emergency Fund",
         current_balance=500000,
-        target_balance=1000000,
+        target_balance=GOAL_TARGET,
     )
-    session.add_all([account, payee, envelope])
+    session.add(envelope)
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
-    )
+    response = await authenticated_client.get(savings_goal_url(user_budget.id))
     assert response.status_code == 200
     data = response.json()
 
@@ -53,7 +46,7 @@ async def test_savings_goal_progress_basic(
 
     item = data["items"][0]
     assert item["envelope_name"] == "Emergency Fund"
-    assert item["target_balance"] == 1000000
+    assert item["target_balance"] == GOAL_TARGET
     assert item["current_balance"] == 500000
     assert item["progress_percent"] == 50
     assert item["remaining"] == 500000
@@ -62,60 +55,56 @@ async def test_savings_goal_progress_basic(
 async def test_savings_goal_progress_with_contributions(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that monthly contribution rate and ETA are calculated."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Employer")
-    # Goal: $10,000, current: $5,000
-    envelope = Envelope(
-        budget_id=budget.id,
-        name="Emergency Fund",
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Employer")
+    # Current: $5,000
+    envelope = make_envelope(
+        user_budget,
+        "Emergency Fund",
         current_balance=500000,
-        target_balance=1000000,
+        target_balance=GOAL_TARGET,
     )
     session.add_all([account, payee, envelope])
-    await session.flush()
 
     # Create contributions over the last 90 days
     # $1000 total over 90 days = ~$333/month
-    today = date.today()
-    for i in range(3):
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=today - timedelta(days=i * 30),
-            amount=100000,
-            status=TransactionStatus.POSTED,
-        )
-        session.add(txn)
-        await session.flush()
-        session.add(
-            Allocation(
-                budget_id=budget.id,
-                envelope_id=envelope.id,
-                transaction_id=txn.id,
-                group_id=uuid7(),
-                amount=33333,  # $333 contribution
-                date=txn.date,
+    contribution_dates = [today - timedelta(days=i * 30) for i in range(3)]
+    result = await session.execute(
+        insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "date": txn_date,
+                "amount": 100000,
+                "status": TransactionStatus.POSTED,
+            }
+            for txn_date in contribution_dates
+        ],
+    )
+    await session.execute(
+        insert(Allocation),
+        [
+            {
+                "budget_id": user_budget.id,
+                "envelope_id": envelope.id,
+                "transaction_id": txn_id,
+                "group_id": uuid7(),
+                "amount": 33333,  # $333 contribution
+                "date": txn_date,
+            }
+            for txn_id, txn_date in zip(
+                result.scalars().all(), contribution_dates, strict=True
             )
-        )
-    await session.flush()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
+        ],
     )
+
+    response = await authenticated_client.get(savings_goal_url(user_budget.id))
     assert response.status_code == 200
     data = response.json()
 
@@ -129,41 +118,29 @@ async def test_savings_goal_progress_with_contributions(
 async def test_savings_goal_progress_multiple_goals(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test multiple goals sorted by progress."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    # 80% progress
-    goal1 = Envelope(
-        budget_id=budget.id,
-        name="Vacation",
-        current_balance=800000,
-        target_balance=1000000,
+    # Vacation 80%, Emergency Fund 50%, New Car 25% of a $10,000 target
+    goals = [
+        ("Vacation", 800000),
+        ("Emergency Fund", 500000),
+        ("New Car", 250000),
+    ]
+    await session.execute(
+        insert(Envelope),
+        [
+            {
+                "budget_id": user_budget.id,
+                "name": name,
+                "current_balance": current_balance,
+                "target_balance": GOAL_TARGET,
+            }
+            for name, current_balance in goals
+        ],
     )
-    # 50% progress
-    goal2 = Envelope(
-        budget_id=budget.id,
-        name="Emergency Fund",
-        current_balance=500000,
-        target_balance=1000000,
-    )
-    # 25% progress
-    goal3 = Envelope(
-        budget_id=budget.id,
-        name="New Car",
-        current_balance=250000,
-        target_balance=1000000,
-    )
-    session.add_all([goal1, goal2, goal3])
-    await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
-    )
+    response = await authenticated_client.get(savings_goal_url(user_budget.id))
     assert response.status_code == 200
     data = response.json()
 
@@ -177,108 +154,73 @@ async def test_savings_goal_progress_multiple_goals(
     assert data["items"][2]["progress_percent"] == 25
 
 
-async def test_savings_goal_progress_goal_reached(
+@pytest.mark.parametrize(
+    (
+        "current_balance",
+        "expected_progress",
+        "expected_remaining",
+        "expected_months",
+    ),
+    [
+        # $12,000 saved against a $10,000 target
+        pytest.param(1200000, 100, 0, 0, id="goal_reached"),
+        # Nothing saved and no contribution history, so no estimate
+        pytest.param(0, 0, GOAL_TARGET, None, id="no_contributions"),
+    ],
+)
+async def test_savings_goal_progress_single_goal(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
+    current_balance: int,
+    expected_progress: int,
+    expected_remaining: int,
+    expected_months: int | None,
 ) -> None:
-    """Test goal that has been reached."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    # Over the target
-    envelope = Envelope(
-        budget_id=budget.id,
-        name="Completed Goal",
-        current_balance=1200000,  # $12,000
-        target_balance=1000000,  # $10,000
+    """Test progress and ETA for a goal without contributions."""
+    envelope = make_envelope(
+        user_budget, "Goal", current_balance=current_balance, target_balance=GOAL_TARGET
     )
     session.add(envelope)
     await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
-    )
-    assert response.status_code == 200
-    data = response.json()
-
-    item = data["items"][0]
-    assert item["progress_percent"] == 100
-    assert item["remaining"] == 0
-    assert item["estimated_months_to_goal"] == 0
-
-
-async def test_savings_goal_progress_no_contributions(
-    authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,
-) -> None:
-    """Test goal with no contribution history."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    envelope = Envelope(
-        budget_id=budget.id,
-        name="New Goal",
-        current_balance=0,
-        target_balance=1000000,
-    )
-    session.add(envelope)
-    await session.flush()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
-    )
+    response = await authenticated_client.get(savings_goal_url(user_budget.id))
     assert response.status_code == 200
     data = response.json()
 
     item = data["items"][0]
+    assert item["progress_percent"] == expected_progress
+    assert item["remaining"] == expected_remaining
     assert item["monthly_contribution_rate"] == 0
-    assert item["estimated_months_to_goal"] is None  # Can't estimate
+    assert item["estimated_months_to_goal"] == expected_months
 
 
 async def test_savings_goal_progress_excludes_non_goals(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that envelopes without target_balance are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    # Has target - should be included
-    goal = Envelope(
-        budget_id=budget.id,
-        name="Goal",
-        current_balance=500000,
-        target_balance=1000000,
-    )
-    # No target - should be excluded
-    regular = Envelope(
-        budget_id=budget.id,
-        name="Regular",
-        current_balance=500000,
-        target_balance=None,
-    )
-    # Zero target - should be excluded
-    zero_target = Envelope(
-        budget_id=budget.id,
-        name="Zero Target",
-        current_balance=500000,
-        target_balance=0,
+    # Only the envelope with a positive target is a goal
+    envelopes = [
+        ("Goal", GOAL_TARGET),
+        ("Regular", None),
+        ("Zero Target", 0),
+    ]
+    await session.execute(
+        insert(Envelope),
+        [
+            {
+                "budget_id": user_budget.id,
+                "name": name,
+                "current_balance": 500000,
+                "target_balance": target_balance,
+            }
+            for name, target_balance in envelopes
+        ],
     )
-    session.add_all([goal, regular, zero_target])
-    await session.flush()
 
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
-    )
+    response = await authenticated_client.get(savings_goal_url(user_budget.id))
     assert response.status_code == 200
     data = response.json()
 
@@ -289,25 +231,17 @@ async def test_savings_goal_progress_excludes_non_goals(
 async def test_savings_goal_progress_custom_period(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test custom calculation period."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    envelope = Envelope(
-        budget_id=budget.id,
-        name="Goal",
-        current_balance=500000,
-        target_balance=1000000,
+    envelope = make_envelope(
+        user_budget, "Goal", current_balance=500000, target_balance=GOAL_TARGET
     )
     session.add(envelope)
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress",
+        savings_goal_url(user_budget.id),
         params={"calculation_period_days": 180},
     )
     assert response.status_code == 200
@@ -318,18 +252,10 @@ async def test_savings_goal_progress_custom_period(
 
 async def test_savings_goal_progress_empty(
     authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test with no savings goals."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/savings-goal-progress"
-    )
+    response = await authenticated_client.get(savings_goal_url(user_budget.id))
     assert response.status_code == 200
     data = response.json()
 
@@ -338,17 +264,8 @@ async def test_savings_goal_progress_empty(
 
 async def test_savings_goal_progress_unauthorized(
     authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,  # noqa: ARG001
-    test_user2: User,
+    user2_budget: Budget,
 ) -> None:
     """Test that users cannot access other budgets' reports."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user2.id)
-    )
-    other_budget = result.scalar_one()
-
-    response = await authenticated_client.get(
-        f"/api/v1/budgets/{other_budget.id}/reports/savings-goal-progress"
-    )
+    response = await authenticated_client.get(savings_goal_url(user2_budget.id))
     assert response.status_code == 403
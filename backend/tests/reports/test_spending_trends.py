@@ -2,69 +2,44 @@ from datetime import date
 from uuid import uuid7
 
 from httpx import AsyncClient
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.accounts.models import Account, AccountType
 from src.allocations.models import Allocation
 from src.budgets.models import Budget
-from src.envelopes.models import Envelope
-from src.payees.models import Payee
-from src.transactions.models import Transaction, TransactionStatus
-from src.users.models import User
+from src.transactions.models import TransactionStatus
+from tests.reports.factories import (
+    make_account,
+    make_envelope,
+    make_payee,
+    make_txn,
+    seed_spending,
+)
 
 
 async def test_spending_trends_basic(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test basic spending trends report."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    envelope = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    envelope = make_envelope(user_budget, "Groceries")
     session.add_all([account, payee, envelope])
-    await session.flush()
 
     # Create spending in January and February 2024
     jan = date(2024, 1, 15)
     feb = date(2024, 2, 15)
-
-    for txn_date, amount in [(jan, -10000), (jan, -15000), (feb, -20000)]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=txn_date,
-            amount=amount,
-            status=TransactionStatus.POSTED,
-        )
-        session.add(txn)
-        await session.flush()
-        session.add(
-            Allocation(
-                budget_id=budget.id,
-                envelope_id=envelope.id,
-                transaction_id=txn.id,
-                group_id=uuid7(),
-                amount=amount,
-                date=txn_date,
-            )
-        )
-    await session.flush()
+    await seed_spending(
+        session,
+        user_budget,
+        account,
+        payee,
+        [(envelope, -10000, jan), (envelope, -15000, jan), (envelope, -20000, feb)],
+    )
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-02-29"},
     )
     assert response.status_code == 200
@@ -96,61 +71,29 @@ async def test_spending_trends_basic(
 async def test_spending_trends_multiple_envelopes(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test trends across multiple envelopes sorted by total spent."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    groceries = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
-    gas = Envelope(budget_id=budget.id, name="Gas", current_balance=0)
-    dining = Envelope(budget_id=budget.id, name="Dining", current_balance=0)
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    groceries = make_envelope(user_budget, "Groceries")
+    gas = make_envelope(user_budget, "Gas")
+    dining = make_envelope(user_budget, "Dining")
     session.add_all([account, payee, groceries, gas, dining])
-    await session.flush()
 
     jan = date(2024, 1, 15)
 
     # Groceries: $500, Gas: $200, Dining: $300
-    spending = [
-        (groceries.id, -50000),
-        (gas.id, -20000),
-        (dining.id, -30000),
-    ]
-
-    for envelope_id, amount in spending:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=jan,
-            amount=amount,
-            status=TransactionStatus.POSTED,
-        )
-        session.add(txn)
-        await session.flush()
-        session.add(
-            Allocation(
-                budget_id=budget.id,
-                envelope_id=envelope_id,
-                transaction_id=txn.id,
-                group_id=uuid7(),
-                amount=amount,
-                date=jan,
-            )
-        )
-    await session.flush()
+    await seed_spending(
+        session,
+        user_budget,
+        account,
+        payee,
+        [(groceries, -50000, jan), (gas, -20000, jan), (dining, -30000, jan)],
+    )
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
     )
     assert response.status_code == 200
@@ -169,52 +112,21 @@ async def test_spending_trends_multiple_envelopes(
 async def test_spending_trends_fills_empty_months(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that months with no spending show zero."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    envelope = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    envelope = make_envelope(user_budget, "Groceries")
     session.add_all([account, payee, envelope])
-    await session.flush()
 
     # Only spend in January, skip February
     jan = date(2024, 1, 15)
-    txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=jan,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(txn)
-    await session.flush()
-    session.add(
-        Allocation(
-            budget_id=budget.id,
-            envelope_id=envelope.id,
-            transaction_id=txn.id,
-            group_id=uuid7(),
-            amount=-10000,
-            date=jan,
-        )
-    )
-    await session.flush()
+    await seed_spending(session, user_budget, account, payee, [(envelope, -10000, jan)])
 
     # Query for Jan-Feb
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-02-29"},
     )
     assert response.status_code == 200
@@ -236,54 +148,27 @@ async def test_spending_trends_fills_empty_months(
 async def test_spending_trends_filter_by_envelope(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test filtering to specific envelopes."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    groceries = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
-    gas = Envelope(budget_id=budget.id, name="Gas", current_balance=0)
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    groceries = make_envelope(user_budget, "Groceries")
+    gas = make_envelope(user_budget, "Gas")
     session.add_all([account, payee, groceries, gas])
-    await session.flush()
 
     jan = date(2024, 1, 15)
-
-    for envelope in [groceries, gas]:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=jan,
-            amount=-10000,
-            status=TransactionStatus.POSTED,
-        )
-        session.add(txn)
-        await session.flush()
-        session.add(
-            Allocation(
-                budget_id=budget.id,
-                envelope_id=envelope.id,
-                transaction_id=txn.id,
-                group_id=uuid7(),
-                amount=-10000,
-                date=jan,
-            )
-        )
-    await session.flush()
+    await seed_spending(
+        session,
+        user_budget,
+        account,
+        payee,
+        [(groceries, -10000, jan), (gas, -10000, jan)],
+    )
 
     # Filter to groceries only
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={
             "start_date": "2024-01-01",
             "end_date": "2024-01-31",
@@ -300,74 +185,28 @@ async def test_spending_trends_filter_by_envelope(
 async def test_spending_trends_excludes_income(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that positive allocations (income/refunds) are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    envelope = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    envelope = make_envelope(user_budget, "Groceries")
     session.add_all([account, payee, envelope])
-    await session.flush()
 
     jan = date(2024, 1, 15)
-
-    # Spending
-    spend_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=jan,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(spend_txn)
-    await session.flush()
-    session.add(
-        Allocation(
-            budget_id=budget.id,
-            envelope_id=envelope.id,
-            transaction_id=spend_txn.id,
-            group_id=uuid7(),
-            amount=-10000,
-            date=jan,
-        )
+    await seed_spending(
+        session,
+        user_budget,
+        account,
+        payee,
+        [
+            (envelope, -10000, jan),  # Spending
+            (envelope, 5000, jan),  # Refund (should be excluded)
+        ],
     )
 
-    # Refund (should be excluded)
-    refund_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=jan,
-        amount=5000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(refund_txn)
-    await session.flush()
-    session.add(
-        Allocation(
-            budget_id=budget.id,
-            envelope_id=envelope.id,
-            transaction_id=refund_txn.id,
-            group_id=uuid7(),
-            amount=5000,
-            date=jan,
-        )
-    )
-    await session.flush()
-
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
     )
     assert response.status_code == 200
@@ -380,74 +219,41 @@ async def test_spending_trends_excludes_income(
 async def test_spending_trends_excludes_scheduled(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that scheduled transactions are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    envelope = Envelope(budget_id=budget.id, name="Groceries", current_balance=0)
-    session.add_all([account, payee, envelope])
-    await session.flush()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
+    envelope = make_envelope(user_budget, "Groceries")
 
     jan = date(2024, 1, 15)
 
-    # Posted
-    posted_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=jan,
-        amount=-10000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(posted_txn)
-    await session.flush()
-    session.add(
-        Allocation(
-            budget_id=budget.id,
-            envelope_id=envelope.id,
-            transaction_id=posted_txn.id,
-            group_id=uuid7(),
-            amount=-10000,
-            date=jan,
-        )
-    )
-
+    posted_txn = make_txn(user_budget, account, payee, amount=-10000, txn_date=jan)
     # Scheduled (should be excluded)
-    scheduled_txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=jan,
+    scheduled_txn = make_txn(
+        user_budget,
+        account,
+        payee,
         amount=-20000,
+        txn_date=jan,
         status=TransactionStatus.SCHEDULED,
     )
-    session.add(scheduled_txn)
-    await session.flush()
-    session.add(
+    allocations = [
         Allocation(
-            budget_id=budget.id,
+            budget_id=user_budget.id,
             envelope_id=envelope.id,
-            transaction_id=scheduled_txn.id,
+            transaction_id=txn.id,
             group_id=uuid7(),
-            amount=-20000,
+            amount=txn.amount,
             date=jan,
         )
-    )
+        for txn in (posted_txn, scheduled_txn)
+    ]
+    session.add_all([account, payee, envelope, posted_txn, scheduled_txn, *allocations])
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
     )
     assert response.status_code == 200
@@ -459,17 +265,11 @@ async def test_spending_trends_excludes_scheduled(
 
 async def test_spending_trends_empty(
     authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test with no spending data."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
     )
     assert response.status_code == 200
@@ -481,18 +281,11 @@ async def test_spending_trends_empty(
 
 async def test_spending_trends_unauthorized(
     authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,  # noqa: ARG001
-    test_user2: User,
+    user2_budget: Budget,
 ) -> None:
     """Test that users cannot access other budgets' reports."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user2.id)
-    )
-    other_budget = result.scalar_one()
-
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{other_budget.id}/reports/spending-trends",
+        f"/api/v1/budgets/{user2_budget.id}/reports/spending-trends",
         params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
     )
     assert response.status_code == 403
@@ -1,76 +1,63 @@
 from datetime import date, timedelta
 
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.accounts.models import Account, AccountType
 from src.budgets.models import Budget
-from src.envelopes.models import Envelope
-from src.payees.models import Payee
-from src.recurring_transactions.models import FrequencyUnit, RecurringTransaction
 from src.transactions.models import Transaction, TransactionStatus
-from src.users.models import User
+from tests.reports.factories import (
+    make_account,
+    make_envelope,
+    make_payee,
+    make_recurring,
+    make_txn,
+)
 
 
 async def test_upcoming_expenses_basic(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test basic upcoming expenses retrieval."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Insurance Co")
+    envelope = make_envelope(user_budget, "Insurance", current_balance=50000)
 
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Insurance Co")
-    envelope = Envelope(budget_id=budget.id, name="Insurance", current_balance=50000)
-    session.add_all([account, payee, envelope])
-    await session.flush()
+    future_date = today + timedelta(days=15)
 
     # Create recurring transaction linked to envelope
-    recurring = RecurringTransaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
+    recurring = make_recurring(
+        user_budget,
+        account,
+        payee,
         amount=-10000,
-        frequency_value=1,
-        frequency_unit=FrequencyUnit.MONTHS,
-        start_date=date.today(),
-        next_occurrence_date=date.today() + timedelta(days=15),
-        envelope_id=envelope.id,
+        next_occurrence_date=future_date,
+        envelope=envelope,
     )
-    session.add(recurring)
-    await session.flush()
 
     # Create scheduled transaction
-    future_date = date.today() + timedelta(days=15)
-    txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        recurring_transaction_id=recurring.id,
-        date=future_date,
+    txn = make_txn(
+        user_budget,
+        account,
+        payee,
         amount=-10000,
+        txn_date=future_date,
         status=TransactionStatus.SCHEDULED,
+        recurring_transaction_id=recurring.id,
     )
-    session.add(txn)
+    session.add_all([account, payee, envelope, recurring, txn])
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     data = response.json()
 
-    assert data["as_of_date"] == str(date.today())
+    assert data["as_of_date"] == str(today)
     assert len(data["items"]) == 1
 
     item = data["items"][0]
@@ -85,55 +72,39 @@ async def test_upcoming_expenses_basic(
 async def test_upcoming_expenses_needs_attention(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test expense marked as needs_attention when envelope underfunded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Rent")
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Rent")
     # Envelope has less than expense amount
-    envelope = Envelope(budget_id=budget.id, name="Housing", current_balance=50000)
-    session.add_all([account, payee, envelope])
-    await session.flush()
+    envelope = make_envelope(user_budget, "Housing", current_balance=50000)
 
-    recurring = RecurringTransaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
+    future_date = today + timedelta(days=5)
+    recurring = make_recurring(
+        user_budget,
+        account,
+        payee,
         amount=-100000,  # -$1000, more than envelope balance
-        frequency_value=1,
-        frequency_unit=FrequencyUnit.MONTHS,
-        start_date=date.today(),
-        next_occurrence_date=date.today() + timedelta(days=5),
-        envelope_id=envelope.id,
+        next_occurrence_date=future_date,
+        envelope=envelope,
     )
-    session.add(recurring)
-    await session.flush()
 
-    future_date = date.today() + timedelta(days=5)
-    txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        recurring_transaction_id=recurring.id,
-        date=future_date,
+    txn = make_txn(
+        user_budget,
+        account,
+        payee,
         amount=-100000,
+        txn_date=future_date,
         status=TransactionStatus.SCHEDULED,
+        recurring_transaction_id=recurring.id,
     )
-    session.add(txn)
+    session.add_all([account, payee, envelope, recurring, txn])
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     data = response.json()
@@ -146,54 +117,38 @@ async def test_upcoming_expenses_needs_attention(
 async def test_upcoming_expenses_not_linked(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test expense marked as not_linked when no envelope associated."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Misc Vendor")
 
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Misc Vendor")
-    session.add_all([account, payee])
-    await session.flush()
+    future_date = today + timedelta(days=10)
 
     # Recurring transaction without envelope
-    recurring = RecurringTransaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
+    recurring = make_recurring(
+        user_budget,
+        account,
+        payee,
         amount=-5000,
-        frequency_value=1,
-        frequency_unit=FrequencyUnit.MONTHS,
-        start_date=date.today(),
-        next_occurrence_date=date.today() + timedelta(days=10),
-        envelope_id=None,
+        next_occurrence_date=future_date,
     )
-    session.add(recurring)
-    await session.flush()
 
-    future_date = date.today() + timedelta(days=10)
-    txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        recurring_transaction_id=recurring.id,
-        date=future_date,
+    txn = make_txn(
+        user_budget,
+        account,
+        payee,
         amount=-5000,
+        txn_date=future_date,
         status=TransactionStatus.SCHEDULED,
+        recurring_transaction_id=recurring.id,
     )
-    session.add(txn)
+    session.add_all([account, payee, recurring, txn])
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     data = response.json()
@@ -207,38 +162,19 @@ async def test_upcoming_expenses_not_linked(
 async def test_upcoming_expenses_excludes_posted(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that posted transactions are not included."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Store")
-    session.add_all([account, payee])
-    await session.flush()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Store")
 
     # Posted transaction (should be excluded)
-    txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=date.today(),
-        amount=-5000,
-        status=TransactionStatus.POSTED,
-    )
-    session.add(txn)
+    txn = make_txn(user_budget, account, payee, amount=-5000, txn_date=date.today())
+    session.add_all([account, payee, txn])
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     data = response.json()
@@ -249,39 +185,28 @@ async def test_upcoming_expenses_excludes_posted(
 async def test_upcoming_expenses_excludes_income(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that positive amounts (income) are excluded."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Employer")
-    session.add_all([account, payee])
-    await session.flush()
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Employer")
 
     # Scheduled income (should be excluded)
-    future_date = date.today() + timedelta(days=14)
-    txn = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=future_date,
+    future_date = today + timedelta(days=14)
+    txn = make_txn(
+        user_budget,
+        account,
+        payee,
         amount=500000,  # Positive = income
+        txn_date=future_date,
         status=TransactionStatus.SCHEDULED,
     )
-    session.add(txn)
+    session.add_all([account, payee, txn])
     await session.flush()
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     data = response.json()
@@ -292,55 +217,40 @@ async def test_upcoming_expenses_excludes_income(
 async def test_upcoming_expenses_days_ahead_filter(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test the days_ahead parameter filters correctly."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Utility")
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Utility")
     session.add_all([account, payee])
-    await session.flush()
 
-    # Transaction within 30 days
-    txn_soon = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=date.today() + timedelta(days=20),
-        amount=-5000,
-        status=TransactionStatus.SCHEDULED,
+    # One transaction within 30 days, one beyond
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "date": today + timedelta(days=days),
+                "amount": -5000,
+                "status": TransactionStatus.SCHEDULED,
+            }
+            for days in [20, 60]
+        ],
     )
-    # Transaction beyond 30 days
-    txn_later = Transaction(
-        budget_id=budget.id,
-        account_id=account.id,
-        payee_id=payee.id,
-        date=date.today() + timedelta(days=60),
-        amount=-5000,
-        status=TransactionStatus.SCHEDULED,
-    )
-    session.add_all([txn_soon, txn_later])
-    await session.flush()
 
     # Default is 90 days, should include both
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     assert len(response.json()["items"]) == 2
 
     # Filter to 30 days, should only include one
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses",
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses",
         params={"days_ahead": 30},
     )
     assert response.status_code == 200
@@ -350,40 +260,32 @@ async def test_upcoming_expenses_days_ahead_filter(
 async def test_upcoming_expenses_sorted_by_date(
     authenticated_client: AsyncClient,
     session: AsyncSession,
-    test_user: User,
+    user_budget: Budget,
 ) -> None:
     """Test that results are sorted by date ascending."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user.id)
-    )
-    budget = result.scalar_one()
-
-    account = Account(
-        budget_id=budget.id,
-        name="Checking",
-        account_type=AccountType.CHECKING,
-        include_in_budget=True,
-    )
-    payee = Payee(budget_id=budget.id, name="Vendor")
+    today = date.today()
+    account = make_account(user_budget)
+    payee = make_payee(user_budget, "Vendor")
     session.add_all([account, payee])
-    await session.flush()
 
     # Create in reverse order
-    dates = [30, 10, 20, 5]
-    for days in dates:
-        txn = Transaction(
-            budget_id=budget.id,
-            account_id=account.id,
-            payee_id=payee.id,
-            date=date.today() + timedelta(days=days),
-            amount=-1000,
-            status=TransactionStatus.SCHEDULED,
-        )
-        session.add(txn)
-    await session.flush()
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "budget_id": user_budget.id,
+                "account_id": account.id,
+                "payee_id": payee.id,
+                "date": today + timedelta(days=days),
+                "amount": -1000,
+                "status": TransactionStatus.SCHEDULED,
+            }
+            for days in [30, 10, 20, 5]
+        ],
+    )
 
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 200
     data = response.json()
@@ -396,17 +298,10 @@ async def test_upcoming_expenses_sorted_by_date(
 
 async def test_upcoming_expenses_unauthorized(
     authenticated_client: AsyncClient,
-    session: AsyncSession,
-    test_user: User,  # noqa: ARG001
-    test_user2: User,
+    user2_budget: Budget,
 ) -> None:
     """Test that users cannot access other budgets' reports."""
-    result = await session.execute(
-        select(Budget).where(Budget.owner_id == test_user2.id)
-    )
-    other_budget = result.scalar_one()
-
     response = await authenticated_client.get(
-        f"/api/v1/budgets/{other_budget.id}/reports/upcoming-expenses"
+        f"/api/v1/budgets/{user2_budget.id}/reports/upcoming-expenses"
     )
     assert response.status_code == 403
@@ -1,5 +1,10 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import Any
 from uuid import uuid4
 
+from sqlalchemy import Engine, event
+
 TEST_USER_EMAIL = "testuser@example.com"
 TEST_USER_USERNAME = "testuser"
 TEST_USER_PASSWORD = "Test" + uuid4().hex[:12] + "!1"
@@ -7,3 +12,24 @@ TEST_USER_PASSWORD = "Test" + uuid4().hex[:12] + "!1"
 TEST_USER2_EMAIL = "testuser2@example.com"
 TEST_USER2_USERNAME = "testuser2"
 TEST_USER2_PASSWORD = "Test" + uuid4().hex[:12] + "!1"
+
+# Statements every authenticated budget request issues before the endpoint
+# runs: the user, budget and membership lookups
+AUTH_QUERIES = 3
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Generator[list[str]]:
+    """Collect the SQL statements executed on the engine inside the block."""
+    statements: list[str] = []
+
+    def _before_cursor_execute(
+        _conn: Any, _cursor: Any, statement: str, *_args: Any
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)